@@ -54,8 +54,11 @@ def Boag_Continuous(Qdensity_C_cm3_s, d_cm, V):
         - f plus 1 std
     """
 
+    # the geometry and charge density factor is shared by all three evaluations
+    ksi_factor = (d_cm**4 / (V * V)) * Qdensity_C_cm3_s
+
     def f_c(mu):
-        ksi_squared = mu * (d_cm**4 / (V * V)) * Qdensity_C_cm3_s
+        ksi_squared = mu * ksi_factor
         return 1.0 / (1 + ksi_squared)
 
     mu_c = alpha / (6 * e_charge * k_1 * k_2)  # [V^2 s / (cm C)]
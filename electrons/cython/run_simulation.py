@@ -1,9 +1,18 @@
-import argparse
+import sys
 
-from electrons.cython.continuous_e_beam import continuous_beam_PDEsolver
-from electrons.cython.pulsed_e_beam import pulsed_beam_PDEsolver
+SOLVER_NAMES = ("continous", "pulsed")
 
-SOLVER_MAP = {"continous": continuous_beam_PDEsolver, "pulsed": pulsed_beam_PDEsolver}
+
+def get_solver(solver_name):
+    # import the solver only when a simulation is run, keeping e.g. --help fast
+    if solver_name == "pulsed":
+        from electrons.cython.pulsed_e_beam import pulsed_beam_PDEsolver
+
+        return pulsed_beam_PDEsolver
+
+    from electrons.cython.continuous_e_beam import continuous_beam_PDEsolver
+
+    return continuous_beam_PDEsolver
 
 
 def run_simulation(
@@ -21,17 +30,24 @@ def run_simulation(
         "print_parameters": False,
     }
 
-    if solver_name not in SOLVER_MAP.keys():
+    if solver_name not in SOLVER_NAMES:
         print(f'Invalid solver type "{solver_name}", defaulting to Continous solver.')
         solver_name = "continous"
 
     if verbose:
-        print(f"Running the simulation using the {solver_name} solver.")
-        print(f"Voltage: {voltage_V} [V]")
-        print(f"Electrode gap: {electrode_gap} [cm]")
-        print(f"Electron density per cm3: {electron_density_per_cm3}")
-
-    solver = SOLVER_MAP[solver_name]
+        # write the header in a single call instead of one write per line
+        header = "\n".join(
+            [
+                f"Running the simulation using the {solver_name} solver.",
+                f"Voltage: {voltage_V} [V]",
+                f"Electrode gap: {electrode_gap} [cm]",
+                f"Electron density per cm3: {electron_density_per_cm3}",
+            ]
+        )
+        sys.stdout.write(header + "\n")
+        sys.stdout.flush()
+
+    solver = get_solver(solver_name)
 
     # return the collection efficiency
     result = solver(parameters)
@@ -45,25 +61,30 @@ def run_simulation(
 
 
 if __name__ == "__main__":
+    # the common "run_simulation.py <solver>" call needs no parser
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        args = {"solver_name": sys.argv[1]}
+    else:
+        import argparse
 
-    parser = argparse.ArgumentParser()
+        parser = argparse.ArgumentParser()
 
-    parser.add_argument(
-        "solver_name",
-        type=str,
-        default="continous",
-        help="The type of the solver to use",
-    )
+        parser.add_argument(
+            "solver_name",
+            type=str,
+            default="continous",
+            help="The type of the solver to use",
+        )
 
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        type=bool,
-        default=True,
-    )
+        parser.add_argument(
+            "--verbose",
+            "-v",
+            type=bool,
+            default=True,
+        )
 
-    args = parser.parse_args()
+        args = vars(parser.parse_args())
 
-    result = run_simulation(**vars(args))
+    result = run_simulation(**args)
 
     print("calculated f is", result)
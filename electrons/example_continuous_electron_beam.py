@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-from Boag_theory import Boag_continuous, e_charge
+from Boag_theory import Boag_Continuous, e_charge
 
 from electrons.cython.continuous_e_beam import continuous_beam_PDEsolver
 
@@ -67,19 +67,23 @@ if __name__ == "__main__":
     )
 
     # Calculate the recombination using IonTracks
-    IonTracks_df = pd.DataFrame()
+    # collect the results and concatenate them once after the loop
+    IonTracks_dfs = []
     for idx, data in data_df.iterrows():
         result_df, _ = IonTracks_continuous(
             voltage_V=data.voltage_V,
             electrode_gap_cm=data.electrode_gap_cm,
             elec_per_cm3=data.elec_per_cm3_s,
         )
-        IonTracks_df = pd.concat([IonTracks_df, result_df], ignore_index=True)
+        IonTracks_dfs.append(result_df)
+    IonTracks_df = pd.concat(IonTracks_dfs, ignore_index=True)
     print(IonTracks_df)
 
-    # rename for plot
-    IonTracks_df["electron_density"] = IonTracks_df["elec_per_cm3"].map(
-        "IonTracks: {:0.2E} e$^{{-}}$/cm$^3$".format
+    # rename for plot, the label is formatted once per distinct density
+    IonTracks_df["electron_density"] = (
+        IonTracks_df["elec_per_cm3"]
+        .astype("category")
+        .cat.rename_categories("IonTracks: {:0.2E} e$^{{-}}$/cm$^3$".format)
     )
 
     # generate the data for the Boag theory
@@ -95,17 +99,17 @@ if __name__ == "__main__":
         data=itertools.product(*data_dict.values()), columns=data_dict.keys()
     )
 
-    # calculate the Boag collection efficiency for each point
-    for idx, data in Boag_df.iterrows():
-        f, _, _ = Boag_continuous(
-            Qdensity_C_cm3_s=data.charge_density_C_cm3_s,
-            d_cm=data.electrode_gap_cm,
-            V=data.voltage_V,
-        )
-        Boag_df.loc[idx, "f"] = f
+    # calculate the Boag collection efficiency for all points at once
+    Boag_df["f"], _, _ = Boag_Continuous(
+        Qdensity_C_cm3_s=Boag_df["charge_density_C_cm3_s"].to_numpy(),
+        d_cm=Boag_df["electrode_gap_cm"].to_numpy(),
+        V=Boag_df["voltage_V"].to_numpy(),
+    )
     Boag_df["ks"] = 1 / Boag_df["f"]
-    Boag_df["charge_density_C_cm3_s"] = Boag_df["charge_density_C_cm3_s"].map(
-        "Boag: {:0.2E} C/cm$^3$".format
+    Boag_df["charge_density_C_cm3_s"] = (
+        Boag_df["charge_density_C_cm3_s"]
+        .astype("category")
+        .cat.rename_categories("Boag: {:0.2E} C/cm$^3$".format)
     )
 
     # plot the results
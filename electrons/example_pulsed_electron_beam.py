@@ -61,19 +61,23 @@ if __name__ == "__main__":
     )
 
     # Calculate the recombination using IonTracks
-    IonTracks_df = pd.DataFrame()
+    # collect the results and concatenate them once after the loop
+    IonTracks_dfs = []
     for idx, data in data_df.iterrows():
         result_df = IonTracks_pulsed(
             voltage_V=data.voltage_V,
             electrode_gap_cm=data.electrode_gap_cm,
             elec_per_cm3=data.elec_per_cm3,
         )
-        IonTracks_df = pd.concat([IonTracks_df, result_df], ignore_index=True)
+        IonTracks_dfs.append(result_df)
+    IonTracks_df = pd.concat(IonTracks_dfs, ignore_index=True)
     print(IonTracks_df)
 
-    # rename for plot
-    IonTracks_df["electron_density"] = IonTracks_df["elec_per_cm3"].map(
-        "IonTracks: {:0.2E} e$^{{-}}$/cm$^3$".format
+    # rename for plot, the label is formatted once per distinct density
+    IonTracks_df["electron_density"] = (
+        IonTracks_df["elec_per_cm3"]
+        .astype("category")
+        .cat.rename_categories("IonTracks: {:0.2E} e$^{{-}}$/cm$^3$".format)
     )
 
     # set parameters for the Boag theorys
@@ -93,17 +97,20 @@ if __name__ == "__main__":
     Boag_df = pd.DataFrame.from_records(
         data=itertools.product(*data_dict.values()), columns=data_dict.keys()
     )
-    # calculate the recombination using the Boag model
-    for idx, data in Boag_df.iterrows():
-        Boag_df.loc[idx, "f"] = Boag_pulsed(
-            data.charge_density_C_cm3, data.electrode_gap_cm, data.voltage_V
-        )
+    # calculate the recombination using the Boag model for all points at once
+    Boag_df["f"] = Boag_pulsed(
+        Boag_df["charge_density_C_cm3"].to_numpy(),
+        Boag_df["electrode_gap_cm"].to_numpy(),
+        Boag_df["voltage_V"].to_numpy(),
+    )
 
     Boag_df["ks"] = 1 / Boag_df["f"]
     print(Boag_df)
     # rename for plot
-    Boag_df["charge_density_C_cm3"] = Boag_df["charge_density_C_cm3"].map(
-        "Boag: {:0.2E} C/cm$^3$".format
+    Boag_df["charge_density_C_cm3"] = (
+        Boag_df["charge_density_C_cm3"]
+        .astype("category")
+        .cat.rename_categories("Boag: {:0.2E} C/cm$^3$".format)
     )
 
     # plot the results
@@ -1,13 +1,18 @@
-import argparse
+import sys
 
-from electrons.numba.continous_e_beam import (
-    NumbaContinousBeamPDEsolver as ContinousBeamPDEsolver,
-)
-from electrons.numba.pulsed_e_beam import (
-    NumbaPulsedBeamPDEsolver as PulsedBeamPDEsolver,
-)
+SOLVER_NAMES = ("continous", "pulsed")
 
-SOLVER_MAP = {"continous": ContinousBeamPDEsolver, "pulsed": PulsedBeamPDEsolver}
+
+def get_solver(solver_name):
+    # import the solver only when a simulation is run, keeping e.g. --help fast
+    if solver_name == "pulsed":
+        from electrons.numba.pulsed_e_beam import NumbaPulsedBeamPDEsolver
+
+        return NumbaPulsedBeamPDEsolver
+
+    from electrons.numba.continous_e_beam import NumbaContinousBeamPDEsolver
+
+    return NumbaContinousBeamPDEsolver
 
 
 def run_simulation(
@@ -18,17 +23,24 @@ def run_simulation(
     verbose=True,
 ):
     # select a solver based on string name, defaukt to ContinousBeamPDEsolver if the name is invalid
-    Solver = SOLVER_MAP.get(solver_name, ContinousBeamPDEsolver)
+    Solver = get_solver(solver_name)
 
-    if solver_name not in SOLVER_MAP.keys():
+    if solver_name not in SOLVER_NAMES:
         print(f'Invalid solver type "{solver_name}", defaulting to Continous solver.')
         solver_name = "continous"
 
     if verbose:
-        print(f"Running the simulation using the {solver_name} solver.")
-        print(f"Voltage: {voltage_V} [V]")
-        print(f"Electrode gap: {electrode_gap} [cm]")
-        print(f"Electron density per cm3: {electron_density_per_cm3}")
+        # write the header in a single call instead of one write per line
+        header = "\n".join(
+            [
+                f"Running the simulation using the {solver_name} solver.",
+                f"Voltage: {voltage_V} [V]",
+                f"Electrode gap: {electrode_gap} [cm]",
+                f"Electron density per cm3: {electron_density_per_cm3}",
+            ]
+        )
+        sys.stdout.write(header + "\n")
+        sys.stdout.flush()
 
     solver = Solver(
         electron_density_per_cm3=electron_density_per_cm3,
@@ -41,24 +53,30 @@ def run_simulation(
 
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
+    # the common "run_simulation.py <solver>" call needs no parser
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        args = {"solver_name": sys.argv[1]}
+    else:
+        import argparse
 
-    parser.add_argument(
-        "solver_name",
-        type=str,
-        default="continous",
-        help="The type of the solver to use",
-    )
+        parser = argparse.ArgumentParser()
 
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        type=bool,
-        default=True,
-    )
+        parser.add_argument(
+            "solver_name",
+            type=str,
+            default="continous",
+            help="The type of the solver to use",
+        )
+
+        parser.add_argument(
+            "--verbose",
+            "-v",
+            type=bool,
+            default=True,
+        )
 
-    args = parser.parse_args()
+        args = vars(parser.parse_args())
 
-    result = run_simulation(**vars(args))
+    result = run_simulation(**args)
 
     print(f"calculated f is {result}")
@@ -21,8 +21,8 @@ data_df = pd.DataFrame.from_records(
 )
 
 # calcualte the ion recombination correction factor using IonTracks
-IonTracks_df = pd.DataFrame()
-for idx, data in data_df.iterrows():
+IonTracks_dfs = []
+for data in data_df.itertuples(index=True):
     result_df = IonTracks_continuous_beam(
         E_MeV_u=data.E_MeV_u,
         voltage_V=data.voltage_V,
@@ -30,8 +30,9 @@ for idx, data in data_df.iterrows():
         doserate_Gy_min=data.doserate_Gy_min,
     )
 
-    IonTracks_df = pd.concat([IonTracks_df, result_df], ignore_index=True)
-    print(idx, IonTracks_df)
+    IonTracks_dfs.append(result_df)
+    print(data.Index, result_df)
+IonTracks_df = pd.concat(IonTracks_dfs, ignore_index=True)
 
 # plot
 fig, ax = plt.subplots()
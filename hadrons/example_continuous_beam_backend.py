@@ -1,27 +1,161 @@
+import argparse
 import itertools
-import sys
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from functions import IonTracks_continuous_beam
+from functions import IonTracks_continuous_beam, get_continuous_beam_solver
+
+# columns computed by the simulation, the other columns are its input parameters
+RESULT_COLUMNS = ("LET_keV_um", "fluencerate_cm2_s", "ks_IonTracks")
+
+
+def _call_continuous(kwargs):
+    """
+    Run a single continuous beam simulation in a worker process and return its
+    scalar result columns (LET, fluence-rate and k_s). A failing simulation
+    returns None instead of bringing down the whole pool.
+    """
+    idx = kwargs.pop("idx")
+    try:
+        result_df = IonTracks_continuous_beam(**kwargs)
+    except Exception as e:
+        print(f"Simulation {idx} failed: {e}")
+        return idx, None
+    return idx, result_df.iloc[0][list(RESULT_COLUMNS)].to_dict()
+
+
+def plot_results(IonTracks_df, output_path):
+    # the plotting libraries are slow to import and not needed by the
+    # simulation workers, import them only once there is something to plot
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    # plot on a standalone figure, bypassing the global pyplot state
+    fig = Figure()
+    ax = fig.subplots()
+    sns.lineplot(
+        ax=ax,
+        data=IonTracks_df,
+        x="doserate_Gy_min",
+        y="ks_IonTracks",
+        hue="voltage_V",
+        style="particle",
+        markers=True,
+    )
+    ax.set_xscale("log")
+    ax.set_xlabel("Dose rate (Gy/s)")
+    ax.set_ylabel("$k_s$ (IonTracks)")
+    fig.savefig(output_path, bbox_inches="tight")
+
+
+def _positive_int(value):
+    jobs = int(value)
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return jobs
+
+
+def configure_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "backends",
+        nargs="?",
+        default="cython",
+        help="Comma-separated list of backends, e.g. cython,numba. All of them "
+        "are run in one process so the interpreter and imports are paid once",
+    )
+    parser.add_argument(
+        "seed",
+        nargs="?",
+        type=int,
+        default=None,
+        help="Seed for the track sampling, shared by all backends. A random "
+        "seed is drawn and printed if not given",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        default=1,
+        help="Number of worker processes running simulations in parallel. "
+        "Defaults to 1, so the elapsed times of the backends are comparable and "
+        "the multi-threaded (parallel) or GPU (cupy) backends are not oversubscribed",
+    )
+    return parser
+
+
+def run_backend(data_df, backend, seed, artifacts_dir, jobs=1):
+    # fail before starting any worker or writing any output if the backend is
+    # unknown or its dependencies (e.g. cupy) are not installed
+    get_continuous_beam_solver(backend)
+
+    # Prepare output file for the results
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = os.path.join(artifacts_dir, f"IonTracks_results_{backend}_{timestamp}.txt")
+    start_time = time.time()
+
+    # the simulations are independent, spawn a statistically independent
+    # (and reproducible for a given seed) random stream for each of them
+    child_seeds = np.random.SeedSequence(seed).spawn(len(data_df))
+
+    # extract the columns once, so the workers receive plain Python scalars
+    energies = data_df["E_MeV_u"].to_numpy()
+    voltages = data_df["voltage_V"].to_numpy()
+    particles = data_df["particle"].to_numpy()
+    electrode_gaps = data_df["electrode_gap_cm"].to_numpy()
+    doserates = data_df["doserate_Gy_min"].to_numpy()
+    total_rows = len(energies)
+    kwargs_list = [
+        dict(
+            idx=i,
+            E_MeV_u=float(energies[i]),
+            voltage_V=float(voltages[i]),
+            particle=str(particles[i]),
+            electrode_gap_cm=float(electrode_gaps[i]),
+            doserate_Gy_min=float(doserates[i]),
+            backend=backend,
+            # the cython solver stores the seed in a C int, keep it to 31 bits
+            myseed=int(child_seeds[i].generate_state(1)[0] >> 1),
+        )
+        for i in range(total_rows)
+    ]
+    # collect the results column-wise instead of concatenating one-row data
+    # frames, failed simulations are left as NaN
+    result_columns = {column: [np.nan] * total_rows for column in RESULT_COLUMNS}
+    # report progress about ten times, short runs only report the first and last
+    progress_step = max(1, total_rows // 10)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for idx, result in executor.map(_call_continuous, kwargs_list, chunksize=1):
+            if result is not None:
+                for column, value in result.items():
+                    result_columns[column][idx] = value
+            if idx in (0, total_rows - 1) or (
+                progress_step > 1 and idx % progress_step == 0
+            ):
+                print(f"Finished simulation {idx + 1}/{total_rows}")
+    IonTracks_df = data_df.assign(**result_columns)
+
+    elapsed = time.time() - start_time
+    # serialize the final table once, straight into the output file
+    with open(filename, "w") as f:
+        IonTracks_df.to_csv(f, sep="\t", index=False)
+        f.write(f"Elapsed time: {elapsed:.3f} s\n")
+    print(f"Results saved to {filename}")
+
+    plot_results(
+        IonTracks_df,
+        os.path.join(artifacts_dir, f"IonTracks_continuous_beam_{backend}.pdf"),
+    )
 
 
 def main():
-    # Parse backend argument
-    if len(sys.argv) > 1:
-        backend = sys.argv[1].lower()
-    else:
-        backend = "cython"
-    args = {}
-    if len(sys.argv) > 2:
-        try:
-            args['myseed'] = int(sys.argv[2])
-        except:
-            raise ValueError("seed should be a number")
+    args = configure_parser().parse_args()
+    backends = [backend.strip().lower() for backend in args.backends.split(",")]
+
     # set parameters
     data_dict = dict(
         electrode_gap_cm=[0.1],
@@ -36,49 +170,21 @@ def main():
         data=itertools.product(*data_dict.values()), columns=data_dict.keys()
     )
 
-    # Prepare output file for stepwise results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     artifacts_dir = "../artifacts"
-    import os
     os.makedirs(artifacts_dir, exist_ok=True)
-    filename = os.path.join(artifacts_dir, f"IonTracks_results_{backend}_{timestamp}.txt")
-    IonTracks_df = pd.DataFrame()
-    start_time = time.time()
-    results_str = ""
-    for idx, data in data_df.iterrows():
-        result_df = IonTracks_continuous_beam(
-            E_MeV_u=data.E_MeV_u,
-            voltage_V=data.voltage_V,
-            particle=data.particle,
-            doserate_Gy_min=data.doserate_Gy_min,
-            backend=backend,
-            **args
-        )
-        IonTracks_df = pd.concat([IonTracks_df, result_df], ignore_index=True)
-        results_str += f"Step {idx}\n"
-        results_str += IonTracks_df.to_csv(sep="\t", index=False)
-        results_str += "\n"
-    elapsed = time.time() - start_time
-    with open(filename, "w") as f:
-        f.write(results_str)
-        f.write(f"Elapsed time: {elapsed:.3f} s\n")
-    print(f"Results saved to {filename}")
 
-    # plot
-    fig, ax = plt.subplots()
-    sns.lineplot(
-        ax=ax,
-        data=IonTracks_df,
-        x="doserate_Gy_min",
-        y="ks_IonTracks",
-        hue="voltage_V",
-        style="particle",
-        markers=True,
-    )
-    ax.set_xscale("log")
-    ax.set_xlabel("Dose rate (Gy/s)")
-    ax.set_ylabel("$k_s$ (IonTracks)")
-    fig.savefig(os.path.join(artifacts_dir, f"IonTracks_continuous_beam_{backend}.pdf"), bbox_inches="tight")
+    # draw the entropy once, so all backends sample the same tracks even
+    # without an explicit seed, and the run can be reproduced from the output
+    seed = np.random.SeedSequence(args.seed).entropy
+    print(f"Seed: {seed}")
+
+    for backend in backends:
+        # a failing backend should not abort the remaining ones
+        try:
+            run_backend(data_df, backend, seed, artifacts_dir, jobs=args.jobs)
+        except Exception as e:
+            print(f"Backend {backend} failed: {e}")
+
 
 if __name__ == "__main__":
     main()
@@ -20,7 +20,7 @@ data_df = pd.DataFrame.from_records(
 )
 
 # use the Jaffe theory for initial recombination for these parameters
-result_df = pd.DataFrame()
+Jaffe_dfs = []
 for idx, data in data_df.iterrows():
     Jaffe_df = Jaffe_theory(
         data.E_MeV_u,
@@ -29,7 +29,8 @@ for idx, data in data_df.iterrows():
         particle=data.particle,
         input_is_LET=False,
     )
-    result_df = pd.concat([result_df, Jaffe_df], ignore_index=True)
+    Jaffe_dfs.append(Jaffe_df)
+result_df = pd.concat(Jaffe_dfs, ignore_index=True)
 
 # plot the results
 fig, ax = plt.subplots()
@@ -50,7 +51,7 @@ data_df_shorter = pd.DataFrame.from_records(
 )
 
 # calculate the recombination with the IonTracks code
-IonTracks_df = pd.DataFrame()
+IonTracks_dfs = []
 for idx, data in data_df_shorter.iterrows():
     temp_df = ks_initial_IonTracks(
         E_MeV_u=data.E_MeV_u,
@@ -60,8 +61,9 @@ for idx, data in data_df_shorter.iterrows():
         RDD_model="Gauss",
     )
 
-    IonTracks_df = pd.concat([IonTracks_df, temp_df], ignore_index=True)
-    print(IonTracks_df)
+    IonTracks_dfs.append(temp_df)
+    print(temp_df)
+IonTracks_df = pd.concat(IonTracks_dfs, ignore_index=True)
 
 # add to the plot
 sns.scatterplot(data=IonTracks_df, ax=ax, x="E_MeV_u", y="ks", label="IonTracks")
@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 from math import exp, log, pi, sin, sqrt
 from pathlib import Path
 
@@ -8,7 +9,6 @@ import pandas as pd
 from scipy.interpolate import interp1d
 from scipy.special import hankel1
 
-from hadrons.cython_files.continuous_beam import continuous_beam_PDEsolver
 from hadrons.cython_files.initial_recombination import single_track_PDEsolver
 
 sys.path.append("./cython_files")
@@ -23,6 +23,12 @@ W = 33.9  # eV/ion pair for air
 ion_diff = 3.7e-2  # cm^2/s, averaged for positive and negative ions
 alpha = 1.60e-6  # cm^3/s, recombination constant
 
+# PSTAR stopping power tables in data_LET for the supported materials
+STOPPING_POWER_FILES = {
+    "dry_air": "stopping_power_air.csv",
+    "water": "stopping_power_water.csv",
+}
+
 
 def Jaffe_theory(
     x,
@@ -110,22 +116,38 @@ def Jaffe_theory(
     return pd.DataFrame([result_dic])
 
 
+@lru_cache(maxsize=None)
+def _load_stopping_power(material):
+    """
+    Read the PSTAR stopping power table for the material. The table is read
+    only once per process, later calls reuse the parsed data frame.
+    """
+    fname = Path(ABS_PATH, "data_LET", STOPPING_POWER_FILES[material])
+    return pd.read_csv(fname, skiprows=3)
+
+
+@lru_cache(maxsize=None)
+def _LET_interpolator(material, particle_col_name):
+    df = _load_stopping_power(material)
+
+    # energy column
+    E_col_name = "E_MeV_u"
+
+    # interpolate the data
+    return interp1d(df[E_col_name], df[particle_col_name])
+
+
 def E_MeV_u_to_LET_keV_um(E_MeV_u, particle="proton", material="dry_air"):
     """
     Calculate the stopping power in dry air or water using PSTAR data
     """
 
-    folder_name = Path(ABS_PATH, "data_LET")
-    if material == "dry_air":
-        fname = Path(folder_name, "stopping_power_air.csv")
-    elif material == "water":
-        fname = Path(folder_name, "stopping_power_water.csv")
-    else:
+    if material not in STOPPING_POWER_FILES:
         print(f"Material {material} not supported")
         return 0
 
     # load the data frame
-    df = pd.read_csv(fname, skiprows=3)
+    df = _load_stopping_power(material)
 
     # LET data for the chosen particle
     particle_col_name = f"{particle}_LET_keV_um"
@@ -135,14 +157,11 @@ def E_MeV_u_to_LET_keV_um(E_MeV_u, particle="proton", material="dry_air"):
         print(f"Particle {particle} is not supported")
         return 0
 
-    # energy column
-    E_col_name = "E_MeV_u"
-
-    # interpolate the data
-    interpolate_LET = interp1d(df[E_col_name], df[particle_col_name])
+    interpolate_LET = _LET_interpolator(material, particle_col_name)
 
     if isinstance(E_MeV_u, (list, tuple, np.ndarray)):
-        LET_keV_um = [interpolate_LET(i) for i in E_MeV_u]
+        # interpolate all energies in a single vectorized pass
+        LET_keV_um = interpolate_LET(np.asarray(E_MeV_u, dtype=float))
     else:
         LET_keV_um = interpolate_LET(E_MeV_u)
     return LET_keV_um
@@ -167,10 +186,10 @@ def doserate_to_fluence(dose_Gy_min, energy_MeV_u, particle="proton"):
     return fluence_cm2_s
 
 
-def calc_b_cm(LET_keV_um):
+@lru_cache(maxsize=None)
+def _track_radius_fit():
     """
-    Calculate the Gaussian track radius as suggested by Rossomme et al.
-    Returns the track radius in cm given a LET [keV/um]
+    Fit of the track radius versus log10(LET), read and fitted once per process
     """
     data = np.genfromtxt(
         Path(ABS_PATH, "data_LET", "LET_b.dat"), delimiter=",", dtype=float
@@ -180,7 +199,15 @@ def calc_b_cm(LET_keV_um):
     b = data[:, 1]
     logLET = np.log10(LET)
     z = np.polyfit(logLET, b, 2)
-    p = np.poly1d(z)
+    return np.poly1d(z)
+
+
+def calc_b_cm(LET_keV_um):
+    """
+    Calculate the Gaussian track radius as suggested by Rossomme et al.
+    Returns the track radius in cm given a LET [keV/um]
+    """
+    p = _track_radius_fit()
 
     b_cm = p(np.log10(LET_keV_um)) * 1e-3
     threshold = 2e-3
@@ -190,6 +217,45 @@ def calc_b_cm(LET_keV_um):
     return b_cm
 
 
+def _ks_initial(
+    E_MeV_u,
+    voltage_V,
+    electrode_gap_cm,
+    particle,
+    RDD_model,
+    grid_size_um,
+    a0_nm,
+    theta_rad,
+    SHOW_PLOT=False,
+    debug=False,
+):
+    """
+    Solve the single track PDE and return the LET (keV/um) and k_s as floats
+    """
+    LET_keV_um = E_MeV_u_to_LET_keV_um(E_MeV_u, particle)
+    track_radius_cm = calc_b_cm(LET_keV_um)
+
+    ks = single_track_PDEsolver(
+        LET_keV_um,
+        voltage_V,
+        theta_rad,
+        electrode_gap_cm,
+        E_MeV_u,
+        a0_nm,
+        RDD_model,
+        grid_size_um * 1e-4,
+        track_radius_cm,
+        SHOW_PLOT=SHOW_PLOT,
+        debug=debug,
+    )
+    return float(LET_keV_um), ks
+
+
+# the single track solver is deterministic, so identical parameter sets
+# (e.g. repeated in parameter sweeps) reuse the previous result
+_cached_ks_initial = lru_cache(maxsize=None)(_ks_initial)
+
+
 def ks_initial_IonTracks(
     E_MeV_u=200,
     voltage_V=200,
@@ -212,37 +278,68 @@ def ks_initial_IonTracks(
         beta = libam.AT_beta_from_E_single(E_MeV_u)
         a0_nm *= beta
 
-    LET_keV_um = E_MeV_u_to_LET_keV_um(E_MeV_u, particle)
-    track_radius_cm = calc_b_cm(LET_keV_um)
+    # plotting and debug output are side effects, do not serve those from the cache
+    if SHOW_PLOT or debug:
+        LET_keV_um, ks = _ks_initial(
+            E_MeV_u,
+            voltage_V,
+            electrode_gap_cm,
+            particle,
+            RDD_model,
+            grid_size_um,
+            a0_nm,
+            theta_rad,
+            SHOW_PLOT=SHOW_PLOT,
+            debug=debug,
+        )
+    else:
+        LET_keV_um, ks = _cached_ks_initial(
+            E_MeV_u,
+            voltage_V,
+            electrode_gap_cm,
+            particle,
+            RDD_model,
+            grid_size_um,
+            a0_nm,
+            theta_rad,
+        )
 
     result_dic = {
         "E_MeV_u": E_MeV_u,
         "voltage_V": voltage_V,
         "electrode_gap_cm": electrode_gap_cm,
-        "LET_keV_um": float(LET_keV_um),
+        "LET_keV_um": LET_keV_um,
         "a0_nm": a0_nm,
         "particle": particle,
         "RDD_model": RDD_model,
         "IC_angle_rad": theta_rad,
     }
-
-    ks = single_track_PDEsolver(
-        LET_keV_um,
-        voltage_V,
-        theta_rad,
-        electrode_gap_cm,
-        E_MeV_u,
-        a0_nm,
-        RDD_model,
-        grid_size_um * 1e-4,
-        track_radius_cm,
-        SHOW_PLOT=SHOW_PLOT,
-        debug=debug,
-    )
     result_dic["ks"] = ks
     return pd.DataFrame([result_dic])
 
 
+def get_continuous_beam_solver(backend="cython"):
+    """
+    Import and return the continuous beam PDE solver of the given backend.
+    The backends are imported on demand, as e.g. cupy is an optional dependency.
+    """
+    if backend == "cython":
+        from hadrons.cython_files.continuous_beam import continuous_beam_PDEsolver
+    elif backend == "python":
+        from hadrons.python.continuous_beam import continuous_beam_PDEsolver
+    elif backend == "numba":
+        from hadrons.numba_files.continuous_beam_numba import continuous_beam_PDEsolver
+    elif backend == "cupy":
+        from hadrons.python_cupy.continuous_beam_cupy import continuous_beam_PDEsolver
+    elif backend == "parallel":
+        from hadrons.parallel.continuous_beam_numba_parallel import (
+            continuous_beam_PDEsolver,
+        )
+    else:
+        raise ValueError(f"Unsupported backend: {backend}")
+    return continuous_beam_PDEsolver
+
+
 def IonTracks_continuous_beam(
     E_MeV_u,
     voltage_V,
@@ -285,21 +382,7 @@ def IonTracks_continuous_beam(
         "seed": myseed,
     }
 
-    if backend == "cython":
-        from hadrons.cython_files.continuous_beam import continuous_beam_PDEsolver
-    elif backend == "python":
-        from hadrons.python.continuous_beam import continuous_beam_PDEsolver
-    elif backend == "numba":
-        from hadrons.numba_files.continuous_beam_numba import continuous_beam_PDEsolver
-    elif backend == "cupy":
-        from hadrons.python_cupy.continuous_beam_cupy import continuous_beam_PDEsolver
-    elif backend == "parallel":
-        from hadrons.parallel.continuous_beam_numba_parallel import (
-            continuous_beam_PDEsolver,
-        )
-    else:
-        raise ValueError(f"Unsupported backend: {backend}")
-
+    continuous_beam_PDEsolver = get_continuous_beam_solver(backend)
     ks = continuous_beam_PDEsolver(result_dic, extra_params_dic)
     result_dic["ks_IonTracks"] = ks
 
@@ -0,0 +1,47 @@
+"""
+test_functions.py
+"""
+
+import numpy as np
+import pytest
+from hadrons.functions import (
+    E_MeV_u_to_LET_keV_um,
+    _cached_ks_initial,
+    ks_initial_IonTracks,
+)
+from pandas.testing import assert_frame_equal
+
+
+@pytest.mark.parametrize("particle", ["proton", "carbon"])
+def test_LET_sequence_matches_scalar(particle):
+    E_MeV_u = [1, 10, 60, 250]
+
+    LET_keV_um = E_MeV_u_to_LET_keV_um(E_MeV_u, particle=particle)
+
+    assert isinstance(LET_keV_um, np.ndarray)
+    assert LET_keV_um.shape == (len(E_MeV_u),)
+    assert np.allclose(
+        LET_keV_um,
+        [E_MeV_u_to_LET_keV_um(E, particle=particle) for E in E_MeV_u],
+    )
+
+
+def test_ks_initial_repeated_call_is_cached():
+    parameters = dict(E_MeV_u=150, voltage_V=300, electrode_gap_cm=0.01, grid_size_um=10.0)
+
+    first = ks_initial_IonTracks(**parameters)
+    hits = _cached_ks_initial.cache_info().hits
+    second = ks_initial_IonTracks(**parameters)
+
+    assert _cached_ks_initial.cache_info().hits == hits + 1
+    assert_frame_equal(first, second)
+
+
+def test_ks_initial_debug_bypasses_cache():
+    parameters = dict(E_MeV_u=150, voltage_V=300, electrode_gap_cm=0.01, grid_size_um=10.0)
+    ks_initial_IonTracks(**parameters)
+    cache_info = _cached_ks_initial.cache_info()
+
+    ks_initial_IonTracks(**parameters, debug=True)
+
+    assert _cached_ks_initial.cache_info() == cache_info